@@ -3,11 +3,19 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 from config import Config
 from contextlib import contextmanager
 
-# Create the database engine
-engine = create_engine(Config.DATABASE_URL, echo=True)
+# Create the database engine with a pooled set of connections reused across requests
+engine = create_engine(
+    Config.DATABASE_URL,
+    echo=True,
+    pool_size=25,  # Connections kept open in the pool
+    max_overflow=25,  # Extra connections allowed under burst load
+    pool_pre_ping=True,  # Detect connections dropped by the server before using them
+    pool_recycle=1800,  # Recycle connections older than 30 minutes
+    pool_use_lifo=True,  # Reuse the most recently returned connection first
+)
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Session factory; objects keep their loaded state after commit so responses built from them don't re-SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base class for ORM models
 Base = declarative_base()
@@ -0,0 +1,25 @@
+"""
+One-shot database schema initializer.
+
+Creates every table (and index) declared in models.py that does not exist yet; existing tables are
+left untouched, so running it again is harmless. Run it once against a fresh database, from the
+backend directory, before starting the app:
+
+    python init_db.py
+
+database/init.sql does not match the models yet, so it cannot be used to provision the schema.
+"""
+from database import engine, Base
+import models  # noqa: F401  Registers the model tables on Base.metadata
+
+
+def init_db():
+    """
+    Create all tables defined in models.py on the configured database.
+    """
+    Base.metadata.create_all(bind=engine)
+
+
+if __name__ == '__main__':
+    init_db()
+    print("Database schema created")
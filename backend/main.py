@@ -1,15 +1,48 @@
-from flask import Flask, request, jsonify
-from datetime import datetime
+import os
+from functools import lru_cache
+from flask import Flask, Response, request, stream_with_context
+from datetime import date, datetime
 from flask_cors import CORS
-from database import engine, Base, SessionLocal
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from database import engine, Base, SessionLocal, get_db
 from routes.room_routes import room_bp
 from models import Reservation, ClientReservations, Room, Client
+from utils.orjson_response import ORJSONProvider, dump_json, json_response, raw_json_response
+from utils.room_cache import get_room_by_name, invalidate_room_cache
 
 app = Flask(__name__)
 CORS(app, origins="http://localhost:4200")  # Change this to match your frontend URL
+app.json = ORJSONProvider(app)  # Serialize jsonify/blueprint responses with orjson
 
-# Simulating an in-memory "database"
-reservations = []
+# Fields every reservation payload must contain
+_REQUIRED_FIELDS = frozenset({'reservationNumber', 'startDate', 'endDate', 'roomName'})
+
+# Constant error bodies, serialized once at import
+_INVALID_PAYLOAD = dump_json({"error": "Request body must be a JSON object"})
+_ROOM_NOT_FOUND = dump_json({"error": "Room not found"})
+_INVALID_DATE_FORMAT = dump_json({"error": "Invalid date format. Use 'YYYY-MM-DD'"})
+_RESERVATION_NOT_CREATED = dump_json({"error": "Reservation could not be created"})
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value):
+    """
+    Parse a 'YYYY-MM-DD' string into a date, memoizing results.
+
+    Check-in and check-out dates repeat heavily across reservations, so most calls are
+    served from the cache instead of being parsed again. Only zero-padded 'YYYY-MM-DD' strings
+    take the fromisoformat fast path; anything else (e.g. '2024-1-5') goes through strptime, so
+    the accepted input is exactly what '%Y-%m-%d' accepts on every Python version (3.11+
+    fromisoformat would also take '20250101' or '2025-W01-1'). Invalid values raise ValueError
+    and are not cached.
+    """
+    if len(value) == 10 and value[4] == value[7] == '-':
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, '%Y-%m-%d').date()
 
 @app.route('/')
 def home():
@@ -21,14 +54,16 @@ def create_reservation():
     """
     Create a new reservation from the JSON payload of a POST request.
     
-    This function extracts reservation details from the incoming JSON payload, validates the presence of
-    required fields ("reservationNumber", "startDate", "endDate", "roomName"), and parses the date strings
-    into datetime objects. It then queries the database to locate the room by its name. If the room is found,
-    a new reservation is created and added to the database. The function commits the transaction and returns
-    a JSON response with the reservation details and a 201 status code. If any validation fails (e.g., missing
-    fields, invalid date formats) or if the room cannot be found, an appropriate error message with a relevant
-    HTTP status code (400, 404, or 500) is returned. The function ensures that the database session is properly
-    closed after the operation, rolling back the transaction in case of errors.
+    This function extracts reservation details from the incoming JSON payload, checks that it is a JSON object,
+    validates that the required fields ("reservationNumber", "startDate", "endDate", "roomName") are present
+    strings, and parses the ISO date strings into date objects. It then queries the database to locate the room
+    by its name.
+    If the room is found, a new reservation is created and added to the database. The function commits the
+    transaction and returns a JSON response with the reservation details and a 201 status code. If any
+    validation fails (e.g., missing fields, invalid date formats) or if the room cannot be found, an
+    appropriate error message with a relevant HTTP status code (400, 404, or 500) is returned. The function
+    ensures that the database session is properly closed after the operation, rolling back the transaction in
+    case of errors.
     
     Returns:
         A Flask JSON response containing:
@@ -40,94 +75,116 @@ def create_reservation():
     Side Effects:
         - Adds a new reservation record to the database.
         - Commits the transaction, generating a new reservation ID.
-        - Prints the room object for debugging purposes.
         
     Note:
         Client association functionality is commented out and may be implemented in a future update.
     """
-    data = request.get_json()
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return raw_json_response(_INVALID_PAYLOAD, 400)
 
     # Validate required fields
-    required_fields = ['reservationNumber', 'startDate', 'endDate', 'roomName']
-    if not all(field in data for field in required_fields):
-        return jsonify({"error": "Missing required fields"}), 400
-
-    session = SessionLocal()
-
-    try:
-        # Validate and parse date fields
-        start_date = datetime.strptime(data['startDate'], '%Y-%m-%d')
-        end_date = datetime.strptime(data['endDate'], '%Y-%m-%d')
-
-        # Find room ID by name
-        room = session.query(Room).filter(Room.name == data['roomName']).first()
-        print(room)
-        if not room:
-            return jsonify({"error": "Room not found"}), 404
-
-        # Check if client exists
-        """ client = session.query(Client).filter(Client.id == data['clientId']).first()
-        if not client:
-            return jsonify({"error": "Client not found"}), 404 """
-
-        # Create a new reservation entry
-        new_reservation = Reservation(
-            id_reference=data['reservationNumber'],
-            start_date=start_date,
-            end_date=end_date,
-            id_room=room.id
-        )
+    missing = _REQUIRED_FIELDS.difference(data)
+    if missing:
+        return json_response({"error": "Missing required fields", "fields": sorted(missing)}, 400)
+    not_strings = [field for field in sorted(_REQUIRED_FIELDS) if not isinstance(data[field], str)]
+    if not_strings:
+        return json_response({"error": "Fields must be strings", "fields": not_strings}, 400)
+
+    with SessionLocal() as session:  # Returns the connection to the pool even if an unexpected error escapes
+        try:
+            # Validate and parse date fields
+            start_date = _parse_iso_date(data['startDate'])
+            end_date = _parse_iso_date(data['endDate'])
+
+            # Find room ID by name
+            room = get_room_by_name(session, data['roomName'])
+            if not room:
+                return raw_json_response(_ROOM_NOT_FOUND, 404)
+
+            # Check if client exists
+            """ client = session.query(Client).filter(Client.id == data['clientId']).first()
+            if not client:
+                return json_response({"error": "Client not found"}, 404) """
+
+            # Create a new reservation entry
+            new_reservation = Reservation(
+                id_reference=data['reservationNumber'],
+                start_date=start_date,
+                end_date=end_date,
+                id_room=room["id"]
+            )
         
-        session.add(new_reservation)
-        session.flush()  # Generate reservation ID
-
-        # Link client to reservation
-        """ client_reservation = ClientReservations(
-            id_reservation=new_reservation.id,
-            id_client=client.id
-        )
-        session.add(client_reservation) """
-
-        # Commit transaction
-        session.commit()
-
-        return jsonify({
-            "message": "Reservation created successfully",
-            "reservation": {
-                "id": new_reservation.id,
-                "reservationNumber": new_reservation.id_reference,
-                "startDate": new_reservation.start_date.strftime('%Y-%m-%d'),
-                "endDate": new_reservation.end_date.strftime('%Y-%m-%d'),
-                "roomName": new_reservation.room.to_dict()
-            }
-        }), 201
-
-    except ValueError:
-        session.rollback()
-        return jsonify({"error": "Invalid date format. Use 'YYYY-MM-DD'"}), 400
-    except Exception as e:
-        session.rollback()
-        return jsonify({"error": str(e)}), 500
-    finally:
-        session.close()
+            session.add(new_reservation)
+            session.flush()  # Generate reservation ID
+
+            # Link client to reservation
+            """ client_reservation = ClientReservations(
+                id_reservation=new_reservation.id,
+                id_client=client.id
+            )
+            session.add(client_reservation) """
+
+            # Commit transaction
+            session.commit()
+
+            return json_response({
+                "message": "Reservation created successfully",
+                "reservation": {
+                    "id": new_reservation.id,
+                    "reservationNumber": new_reservation.id_reference,
+                    "startDate": new_reservation.start_date,
+                    "endDate": new_reservation.end_date,
+                    "roomName": room
+                }
+            }, 201)
+
+        except ValueError:
+            session.rollback()
+            return raw_json_response(_INVALID_DATE_FORMAT, 400)
+        except IntegrityError:
+            session.rollback()
+            if session.get(Room, room["id"]) is None:
+                # The cached room was deleted by another worker; drop the cache so the next request re-resolves it
+                invalidate_room_cache()
+                return raw_json_response(_ROOM_NOT_FOUND, 404)
+            return raw_json_response(_RESERVATION_NOT_CREATED, 500)
+        except Exception as e:
+            session.rollback()
+            return json_response({"error": str(e)}, 500)
 
 # GET endpoint to view all reservations (for testing purposes)
 @app.route('/api/v1/reservations', methods=['GET'])
 def get_reservations():
     """
-    Return a JSON response containing the global reservations list.
+    Stream all reservations as a JSON response.
     
-    This function returns the global reservations list wrapped in a JSON response. The reservations are
-    returned under the key "reservations".
+    Reservations are read from the database in batches of 500 rows (a server-side cursor on PostgreSQL)
+    and each row is serialized with orjson as soon as it is fetched, so memory use stays flat regardless
+    of the table size and the client starts receiving data before the query is exhausted. The reservations
+    are returned under the key "reservations", each in the format of Reservation.to_dict() (serialized
+    from its slotted ReservationDTO projection).
     
     Returns:
-        flask.Response: A JSON response object containing the global reservations list.
+        flask.Response: A streamed JSON response object containing the list of reservations.
     """
-    return jsonify({"reservations": reservations.to_dict()})
-
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
+    def generate():
+        with get_db() as db:
+            yield b'{"reservations":['
+            rows = db.execute(
+                select(Reservation).order_by(Reservation.id).execution_options(yield_per=500)
+            ).scalars()
+            for index, reservation in enumerate(rows):
+                yield (b',' if index else b'') + dump_json(reservation.to_dto())
+            yield b']}'
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+# The schema is created once per database by init_db.py (database/init.sql does not match the models yet).
+# Set AUTO_CREATE_SCHEMA=1 to also create missing tables at import, e.g. for a throwaway dev database.
+if os.getenv("AUTO_CREATE_SCHEMA") == "1":
+    Base.metadata.create_all(bind=engine)
 
 # Register blueprints
 app.register_blueprint(room_bp)
@@ -1,36 +1,52 @@
-from sqlalchemy import Column, Integer, BigInteger, String, Date, ForeignKey, Sequence
+from dataclasses import dataclass, fields
+from datetime import date
+from operator import attrgetter
+from sqlalchemy import Column, Integer, BigInteger, String, Date, ForeignKey, Sequence, Index
 from sqlalchemy.orm import relationship
 from database import Base
 
-class Room(Base):
+
+class SerializableMixin:
+    """
+    Shared to_dict() implementation driven by a class-level tuple of field names.
+
+    Subclasses declare _SERIALIZE_FIELDS; an operator.attrgetter over those fields is built once per
+    class, so to_dict() fetches every attribute in a single C-level call and zips them with the field
+    names instead of building a dict literal attribute by attribute. At least two names are required,
+    since attrgetter returns a bare value rather than a tuple for a single name.
+    """
+    _SERIALIZE_FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._SERIALIZE_FIELDS:
+            if len(cls._SERIALIZE_FIELDS) < 2:
+                raise TypeError(f"{cls.__name__}._SERIALIZE_FIELDS must name at least two fields")
+            cls._serialize_getter = attrgetter(*cls._SERIALIZE_FIELDS)
+
+    def to_dict(self):
+        """
+        Return a dictionary of the instance's _SERIALIZE_FIELDS, keyed by field name.
+
+        This method is primarily used for serializing model instances to JSON or for similar data transfer purposes.
+        """
+        return dict(zip(self._SERIALIZE_FIELDS, self._serialize_getter(self)))
+
+
+class Room(SerializableMixin, Base):
     __tablename__ = "room"
     
     id = Column(BigInteger, Sequence("room_id_seq"), primary_key=True, index=True)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, index=True)  # Indexed for reservation lookups by room name
     capacity = Column(Integer, nullable=False)
     id_structure = Column(BigInteger, ForeignKey("structure.id"), nullable=False)
 
     structure = relationship("Structure", back_populates="rooms")
 
-    def to_dict(self):
-            """
-            Return a dictionary representation of the Room instance.
-            
-            The returned dictionary includes:
-                - "id" (int): The unique identifier of the room.
-                - "name" (str): The name of the room (non-nullable).
-                - "capacity" (int): The maximum capacity of the room (non-nullable).
-                - "id_structure" (int): The identifier of the associated structure (non-nullable).
-            
-            This method is primarily used for serializing the room instance to JSON or for similar data transfer purposes.
-            """
-            return {
-                "id": self.id,
-                "name": self.name,
-                "capacity": self.capacity,
-                "id_structure": self.id_structure,
-            }
-            
+    # to_dict() fields: the room id, its name, maximum capacity and the id of its structure
+    _SERIALIZE_FIELDS = ("id", "name", "capacity", "id_structure")
+
+
 class AdminStructure(Base):
     __tablename__ = "admin_structure"
 
@@ -69,20 +85,50 @@ class Client(Base):
     document_number = Column(String)
     cf = Column(String)
 
-    reservations = relationship("Reservation", secondary="client_reservations", back_populates="clients")  # FIXED
+    # Many-to-many loads must be requested explicitly (e.g. selectinload) instead of lazy-loading per row
+    reservations = relationship("Reservation", secondary="client_reservations", back_populates="clients", lazy="raise_on_sql")  # FIXED
+
 
+@dataclass(slots=True, frozen=True)
+class ReservationDTO:
+    """
+    Slotted, read-only projection of a Reservation used for list serialization.
 
-class Reservation(Base):
+    Instances have no per-instance __dict__ and are serialized natively by orjson, with the
+    same keys and values as Reservation.to_dict().
+    """
+    id: int
+    id_reference: str
+    start_date: date
+    end_date: date
+    id_room: int
+
+
+class Reservation(SerializableMixin, Base):
     __tablename__ = "reservation"
+    __table_args__ = (
+        # Availability checks filter by room and date range
+        Index("ix_reservation_room_dates", "id_room", "start_date", "end_date"),
+    )
 
     id = Column(BigInteger, Sequence("reservation_id_seq"), primary_key=True, index=True)
-    id_reference = Column(String(500), nullable=False)  # "booking or airbnb"
+    id_reference = Column(String(500), nullable=False, index=True)  # "booking or airbnb"
     start_date = Column(Date)
     end_date = Column(Date)
     id_room = Column(BigInteger, ForeignKey("room.id"))
 
     room = relationship("Room")
-    clients = relationship("Client", secondary="client_reservations", back_populates="reservations")  # FIXED
+    clients = relationship("Client", secondary="client_reservations", back_populates="reservations", lazy="raise_on_sql")  # FIXED
+
+    # to_dict() fields, taken from ReservationDTO so to_dto() can fill it positionally in the same order;
+    # dates stay date objects, which the JSON provider serializes as 'YYYY-MM-DD'
+    _SERIALIZE_FIELDS = tuple(field.name for field in fields(ReservationDTO))
+
+    def to_dto(self):
+        """
+        Return a ReservationDTO with the same fields as to_dict(), for hot serialization paths.
+        """
+        return ReservationDTO(*self._serialize_getter(self))
 
 
 class User(Base):
@@ -92,7 +138,7 @@ class User(Base):
     name = Column(String)
     surname = Column(String)
     password = Column(String)
-    username = Column(String)
+    username = Column(String, index=True, unique=True)  # Login lookups filter by username
     id_role = Column(Integer, ForeignKey("role.id"))
 
     role = relationship("Role")
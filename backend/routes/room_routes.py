@@ -3,6 +3,7 @@ from flask import Blueprint, request, jsonify
 from sqlalchemy.orm import Session
 from database import get_db  # Use absolute import
 from models import Room
+from utils.room_cache import invalidate_room_cache
 
 room_bp = Blueprint("room", __name__, url_prefix="/api/v1")
 
@@ -84,7 +85,7 @@ def get_room(room_id):
             - On failure: JSON with an error message and a 404 HTTP status code if no room is found.
     """
     with get_db() as db:  # Using 'with' statement here as well
-        room = db.query(Room).filter(Room.id == room_id).first()
+        room = db.get(Room, room_id)
         if room:
             return jsonify(room.to_dict())
         return jsonify({"error": "Room not found"}), 404
@@ -107,11 +108,12 @@ def delete_room(room_id):
         tuple: A tuple containing a JSON response and an HTTP status code.
     """
     with get_db() as db:  # Again, using 'with' for context management
-        room = db.query(Room).filter(Room.id == room_id).first()
+        room = db.get(Room, room_id)
 
         if room:
             db.delete(room)
             db.commit()
+            invalidate_room_cache()
             return jsonify({"message": "Room deleted successfully"}), 200
 
         return jsonify({"error": "Room not found"}), 404
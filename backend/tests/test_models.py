@@ -0,0 +1,18 @@
+from datetime import date
+import pytest
+from models import Reservation, ReservationDTO, SerializableMixin
+
+def test_serialize_fields_require_two_names():
+    # A single field would make attrgetter return a bare value that to_dict() zips character by character
+    with pytest.raises(TypeError):
+        class SingleField(SerializableMixin):
+            _SERIALIZE_FIELDS = ("name",)
+
+def test_reservation_to_dto_matches_to_dict():
+    # to_dto() fills ReservationDTO positionally, so every field must land under the same name as in to_dict()
+    reservation = Reservation(id=1, id_reference="BK-1", start_date=date(2025, 1, 1), end_date=date(2025, 1, 3), id_room=7)
+    dto = reservation.to_dto()
+    assert isinstance(dto, ReservationDTO)
+    assert {name: getattr(dto, name) for name in reservation.to_dict()} == reservation.to_dict()
+    assert dto.start_date == date(2025, 1, 1)
+    assert dto.end_date == date(2025, 1, 3)
@@ -0,0 +1,219 @@
+import json
+import uuid
+from datetime import date
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from main import app as main_app
+from database import engine, Base, SessionLocal
+from models import Reservation, Room, Structure
+from utils import room_cache
+from utils.room_cache import get_room_by_name, invalidate_room_cache
+
+@pytest.fixture(scope="module")
+def app():
+    """
+    Provide the main Flask application with the database tables created for the reservation tests.
+
+    The tables are created before the tests of this module run and dropped once they complete.
+
+    Yields:
+        Flask: The application defined in main.py.
+    """
+    main_app.config.from_object('config.TestConfig')  # Load testing config
+    Base.metadata.create_all(bind=engine)
+    yield main_app
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def init_db(app):
+    """
+    Start from an empty reservation table with one structure and one uniquely named room.
+
+    Yields:
+        tuple: An active SQLAlchemy session and the persisted Room.
+    """
+    invalidate_room_cache()
+    db = SessionLocal()
+    db.query(Reservation).delete()
+    db.commit()
+
+    structure = Structure(name="Reservation Structure", street="Reservation Street", city="Reservation City")
+    db.add(structure)
+    db.commit()
+    room = Room(name=f"Reservation Room {uuid.uuid4().hex}", capacity=2, id_structure=structure.id)
+    db.add(room)
+    db.commit()
+    yield db, room
+    db.close()
+    invalidate_room_cache()
+
+@pytest.fixture
+def foreign_keys(app):
+    """
+    Enforce foreign keys for the duration of a test.
+
+    PostgreSQL always enforces them; SQLite only does per connection, so the pragma is set on every
+    checkout and the pool is disposed afterwards to keep it from leaking into other tests.
+    """
+    if engine.dialect.name != "sqlite":
+        yield
+        return
+
+    def enable_foreign_keys(dbapi_connection, connection_record, connection_proxy):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    event.listen(engine, "checkout", enable_foreign_keys)
+    yield
+    event.remove(engine, "checkout", enable_foreign_keys)
+    engine.dispose()
+
+def reservation_payload(room_name, **overrides):
+    # Build a valid POST /reservations payload, optionally overriding fields
+    payload = {
+        "reservationNumber": "BK-1",
+        "startDate": "2025-01-01",
+        "endDate": "2025-01-03",
+        "roomName": room_name,
+    }
+    payload.update(overrides)
+    return payload
+
+def test_get_reservations_empty(client, init_db):
+    # Test the GET /reservations endpoint when there are no reservations
+    response = client.get("/api/v1/reservations")
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert json.loads(response.data) == {"reservations": []}
+
+def test_get_reservations(client, init_db):
+    """
+    Test the GET /api/v1/reservations endpoint with stored reservations.
+
+    The streamed body must be valid JSON listing every reservation with its column names as keys
+    and its dates formatted as 'YYYY-MM-DD'.
+    """
+    db, room = init_db
+    db.add_all([
+        Reservation(id_reference="BK-1", start_date=date(2025, 1, 1), end_date=date(2025, 1, 3), id_room=room.id),
+        Reservation(id_reference="BK-2", start_date=date(2025, 2, 10), end_date=date(2025, 2, 12), id_room=room.id),
+    ])
+    db.commit()
+
+    response = client.get("/api/v1/reservations")
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert len(data["reservations"]) == 2
+    first, second = data["reservations"]
+    assert set(first) == {"id", "id_reference", "start_date", "end_date", "id_room"}
+    assert first["id_reference"] == "BK-1"
+    assert first["start_date"] == "2025-01-01"
+    assert first["end_date"] == "2025-01-03"
+    assert first["id_room"] == room.id
+    assert second["start_date"] == "2025-02-10"
+
+def test_create_reservation(client, init_db):
+    # Test the POST /reservations endpoint with a valid payload
+    db, room = init_db
+    response = client.post("/api/v1/reservations", json=reservation_payload(room.name))
+    assert response.status_code == 201
+    data = response.get_json()
+    assert data["message"] == "Reservation created successfully"
+    assert data["reservation"]["reservationNumber"] == "BK-1"
+    assert data["reservation"]["startDate"] == "2025-01-01"
+    assert data["reservation"]["endDate"] == "2025-01-03"
+    assert data["reservation"]["roomName"] == room.to_dict()
+    assert db.get(Reservation, data["reservation"]["id"]) is not None
+
+def test_create_reservation_non_padded_dates(client, init_db):
+    # Dates without zero padding are still accepted, as with strptime('%Y-%m-%d')
+    _, room = init_db
+    response = client.post("/api/v1/reservations", json=reservation_payload(room.name, startDate="2025-1-5", endDate="2025-01-7"))
+    assert response.status_code == 201
+    data = response.get_json()
+    assert data["reservation"]["startDate"] == "2025-01-05"
+    assert data["reservation"]["endDate"] == "2025-01-07"
+
+def test_create_reservation_compact_and_week_dates(client, init_db):
+    # Only '%Y-%m-%d' dates are accepted, whatever the running Python's fromisoformat allows
+    _, room = init_db
+    for start_date in ("20250101", "2025-W01-1", "2025-01-01T00:00"):
+        response = client.post("/api/v1/reservations", json=reservation_payload(room.name, startDate=start_date))
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Invalid date format. Use 'YYYY-MM-DD'"
+
+def test_create_reservation_room_not_found(client, init_db):
+    # Test the POST /reservations endpoint with an unknown room name
+    response = client.post("/api/v1/reservations", json=reservation_payload(f"Missing Room {uuid.uuid4().hex}"))
+    assert response.status_code == 404
+    assert response.get_json()["error"] == "Room not found"
+
+def test_create_reservation_stale_cached_room(client, init_db, foreign_keys):
+    # A cached room deleted outside the API is reported as not found and dropped from the cache
+    db, room = init_db
+    assert get_room_by_name(db, room.name) is not None  # Prime the cache
+    db.query(Room).filter(Room.id == room.id).delete()
+    db.commit()
+
+    response = client.post("/api/v1/reservations", json=reservation_payload(room.name))
+    assert response.status_code == 404
+    assert response.get_json()["error"] == "Room not found"
+    assert room_cache._rooms_by_name == {}
+
+def test_create_reservation_integrity_error(client, init_db, monkeypatch):
+    # Any other integrity failure while the room still exists is a generic 500 that keeps the cache
+    db, room = init_db
+    assert get_room_by_name(db, room.name) is not None  # Prime the cache
+
+    def failing_flush(self, objects=None):
+        raise IntegrityError("INSERT INTO reservation", {}, Exception("driver detail"))
+
+    monkeypatch.setattr(Session, "flush", failing_flush)
+    response = client.post("/api/v1/reservations", json=reservation_payload(room.name))
+    monkeypatch.undo()
+
+    assert response.status_code == 500
+    assert response.get_json() == {"error": "Reservation could not be created"}
+    assert room.name in room_cache._rooms_by_name
+    assert db.query(Reservation).count() == 0
+
+def test_create_reservation_missing_fields(client, init_db):
+    # Test the POST /reservations endpoint with required fields missing
+    response = client.post("/api/v1/reservations", json={"startDate": "2025-01-01"})
+    assert response.status_code == 400
+    data = response.get_json()
+    assert data["error"] == "Missing required fields"
+    assert data["fields"] == ["endDate", "reservationNumber", "roomName"]
+
+def test_create_reservation_non_string_fields(client, init_db):
+    # Required fields of the wrong type are rejected before any date parsing or room lookup
+    _, room = init_db
+    response = client.post("/api/v1/reservations", json=reservation_payload(room.name, startDate=["x"]))
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Fields must be strings", "fields": ["startDate"]}
+
+    response = client.post("/api/v1/reservations", json=reservation_payload(["R1"], reservationNumber=None))
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Fields must be strings", "fields": ["reservationNumber", "roomName"]}
+
+def test_create_reservation_non_object_body(client, init_db):
+    # Test the POST /reservations endpoint with JSON that is not an object, and with malformed JSON
+    response = client.post("/api/v1/reservations", json=["not", "an", "object"])
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Request body must be a JSON object"
+
+    response = client.post("/api/v1/reservations", data="{bad", content_type="application/json")
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Request body must be a JSON object"
+
+def test_create_reservation_invalid_date(client, init_db):
+    # Test the POST /reservations endpoint with a date that is not 'YYYY-MM-DD'
+    _, room = init_db
+    response = client.post("/api/v1/reservations", json=reservation_payload(room.name, startDate="01/01/2025"))
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Invalid date format. Use 'YYYY-MM-DD'"
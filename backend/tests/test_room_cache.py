@@ -0,0 +1,99 @@
+import uuid
+import pytest
+from flask import Flask
+from routes.room_routes import room_bp
+from database import engine, Base, SessionLocal
+from models import Room, Structure
+from utils import room_cache
+from utils.room_cache import get_room_by_name, invalidate_room_cache
+
+@pytest.fixture(scope="module")
+def app():
+    """
+    Create a Flask application with the room blueprint and the database tables required by the room cache tests.
+
+    Yields:
+        Flask: The configured Flask application instance.
+    """
+    app = Flask(__name__)
+    app.config.from_object('config.TestConfig')
+    app.register_blueprint(room_bp)
+    Base.metadata.create_all(bind=engine)
+    yield app
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    # Every test starts and ends with an empty room cache
+    invalidate_room_cache()
+    yield
+    invalidate_room_cache()
+
+@pytest.fixture
+def room(app):
+    """
+    Create a structure and a room with a unique name, yielding an open session and the room.
+
+    Yields:
+        tuple: The SQLAlchemy session and the persisted Room.
+    """
+    db = SessionLocal()
+    structure = Structure(name="Cache Structure", street="Cache Street", city="Cache City")
+    db.add(structure)
+    db.commit()
+    room = Room(name=f"Cache Room {uuid.uuid4().hex}", capacity=2, id_structure=structure.id)
+    db.add(room)
+    db.commit()
+    yield db, room
+    db.close()
+
+def test_get_room_by_name_miss_fetches_and_caches(room):
+    # A first lookup reads the room from the database and stores it in the cache
+    db, created = room
+    result = get_room_by_name(db, created.name)
+    assert result == created.to_dict()
+    assert created.name in room_cache._rooms_by_name
+
+def test_get_room_by_name_hit_serves_cached_room(room):
+    # A second lookup within the TTL is served from the cache, even if the row changed meanwhile
+    db, created = room
+    get_room_by_name(db, created.name)
+    created.capacity = 10
+    db.commit()
+
+    result = get_room_by_name(db, created.name)
+    assert result["capacity"] == 2
+
+def test_get_room_by_name_expired_entry_is_refetched(room, monkeypatch):
+    # Entries older than ROOM_CACHE_TTL are reloaded from the database
+    db, created = room
+    monkeypatch.setattr(room_cache, "ROOM_CACHE_TTL", 0)
+    get_room_by_name(db, created.name)
+    created.capacity = 10
+    db.commit()
+
+    result = get_room_by_name(db, created.name)
+    assert result["capacity"] == 10
+
+def test_get_room_by_name_unknown_name_is_not_cached(app):
+    # Unknown names return None and leave no cache entry, so rooms created later are still found
+    db = SessionLocal()
+    name = f"Missing Room {uuid.uuid4().hex}"
+    assert get_room_by_name(db, name) is None
+    assert name not in room_cache._rooms_by_name
+    db.close()
+
+def test_delete_room_invalidates_cache(client, room):
+    # Deleting a room through the API clears the cache so the stale entry is not served
+    db, created = room
+    get_room_by_name(db, created.name)
+    assert created.name in room_cache._rooms_by_name
+
+    response = client.delete(f"/api/v1/rooms/{created.id}")
+    assert response.status_code == 200
+    assert room_cache._rooms_by_name == {}
+    assert get_room_by_name(db, created.name) is None
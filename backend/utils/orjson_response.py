@@ -0,0 +1,62 @@
+# utils/orjson_response.py
+from functools import partial
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+
+# orjson.dumps with the options shared by every response, bound once per process
+dump_json = partial(orjson.dumps, default=str, option=orjson.OPT_NAIVE_UTC)
+
+
+def json_response(data, status=200):
+    """
+    Build a JSON response whose body is serialized with orjson.
+
+    orjson returns bytes directly, so the payload is handed to Flask without the
+    str -> bytes encoding step that jsonify performs. Values orjson cannot
+    serialize natively are converted with str().
+
+    Parameters:
+        data: The JSON-serializable payload (dict, list, ...).
+        status (int): The HTTP status code of the response. Defaults to 200.
+
+    Returns:
+        flask.Response: A response with mimetype "application/json".
+    """
+    return raw_json_response(dump_json(data), status)
+
+
+def raw_json_response(body, status=200):
+    """
+    Build a JSON response from an already serialized body.
+
+    Used for constant payloads (e.g. error messages) that are encoded once with dump_json
+    at import time, so returning them allocates nothing beyond the Response itself.
+
+    Parameters:
+        body (bytes): The serialized JSON body.
+        status (int): The HTTP status code of the response. Defaults to 200.
+
+    Returns:
+        flask.Response: A response with mimetype "application/json".
+    """
+    return Response(body, status=status, mimetype="application/json")
+
+
+class ORJSONProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Installing it with app.json = ORJSONProvider(app) makes jsonify, request.get_json
+    and every blueprint use orjson instead of the stdlib json module.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return dump_json(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dump_json(obj), mimetype="application/json")
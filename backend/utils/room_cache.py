@@ -0,0 +1,56 @@
+# utils/room_cache.py
+from threading import Lock
+from time import monotonic
+from sqlalchemy import select
+from models import Room
+
+# Seconds a cached room stays valid; bounds how long changes made by other workers go unnoticed
+ROOM_CACHE_TTL = 60
+
+# Process-local map of room name -> (expiry time, serialized room), filled lazily by get_room_by_name()
+_rooms_by_name = {}
+_rooms_by_name_lock = Lock()
+
+_ROOM_COLUMNS = (Room.id, Room.name, Room.capacity, Room.id_structure)
+
+
+def get_room_by_name(session, name):
+    """
+    Return the serialized room with the given name, resolving the name through a process-local cache.
+
+    On a cache miss the room is fetched with a Core select of its columns, so no ORM Room
+    instance is built; the row is stored as the same dictionary Room.to_dict() returns.
+    Entries expire after ROOM_CACHE_TTL seconds, so rooms deleted, recreated or changed by
+    another worker are picked up again without an explicit invalidation. Names that do not
+    match any room are not cached, so rooms created after the first miss are still found.
+    The returned dictionary is shared between callers and must be treated as read-only.
+
+    Parameters:
+        session (Session): The SQLAlchemy session used for the lookup.
+        name (str): The room name to resolve.
+
+    Returns:
+        dict | None: The room's "id", "name", "capacity" and "id_structure", or None if no room has that name.
+    """
+    entry = _rooms_by_name.get(name)
+    if entry is not None and entry[0] > monotonic():
+        return entry[1]
+
+    row = session.execute(select(*_ROOM_COLUMNS).where(Room.name == name).limit(1)).one_or_none()
+    if row is None:
+        if entry is not None:
+            with _rooms_by_name_lock:
+                _rooms_by_name.pop(name, None)  # Expired entry for a room that no longer exists
+        return None
+    room = row._asdict()
+    with _rooms_by_name_lock:
+        _rooms_by_name[name] = (monotonic() + ROOM_CACHE_TTL, room)
+    return room
+
+
+def invalidate_room_cache():
+    """
+    Clear the room name cache. Call after rooms are deleted or renamed, or when a cached room id is rejected by the database.
+    """
+    with _rooms_by_name_lock:
+        _rooms_by_name.clear()
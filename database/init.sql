@@ -14,6 +14,8 @@ CREATE TABLE IF NOT EXISTS Room (
   id_structure bigint
 );
 
+CREATE INDEX IF NOT EXISTS ix_room_name ON Room (name);
+
 CREATE TABLE IF NOT EXISTS admin_structure (
   id_user bigint NOT NULL,
   id_structure bigint NOT NULL,
@@ -58,6 +60,9 @@ CREATE TABLE IF NOT EXISTS Reservation (
 
 COMMENT ON COLUMN Reservation.id_reference IS 'booking or airbnb';
 
+CREATE INDEX IF NOT EXISTS ix_reservation_id_reference ON Reservation (id_reference);
+CREATE INDEX IF NOT EXISTS ix_reservation_room_dates ON Reservation (id_room, start_date, end_date);
+
 CREATE TABLE IF NOT EXISTS "User" (
   id bigint NOT NULL PRIMARY KEY DEFAULT nextval('user_id_seq'),
   name text,
@@ -67,6 +72,8 @@ CREATE TABLE IF NOT EXISTS "User" (
   id_role integer NOT NULL
 );
 
+CREATE UNIQUE INDEX IF NOT EXISTS ix_user_username ON "User" (username);
+
 CREATE TABLE IF NOT EXISTS Structure (
   id bigint NOT NULL PRIMARY KEY DEFAULT nextval('structure_id_seq'),
   name bigint,